@@ -2,7 +2,7 @@ import chromadb
 
 client = chromadb.PersistentClient(path="db_3gpp")  # Ensure persistent storage
 collection = client.get_or_create_collection("3gpp_specs")
-all_data = collection.get()
+all_data = collection.get(include=["metadatas"])  # Only metadatas are printed
 
 if all_data["ids"]:
     print(f"Found {len(all_data['ids'])} stored documents in '3gpp_specs'.")
@@ -5,9 +5,7 @@ def extract_text_from_pdf(pdf_path):
     """Extracts text from a given PDF file"""
     try:
         doc = fitz.open(pdf_path)
-        text = ""
-        for page in doc:
-            text += page.get_text("text") + "\n"
+        text = "".join(page.get_text("text") + "\n" for page in doc)  # Join once instead of += per page
         if text:
             print("Text extracted successfully!")
         else:
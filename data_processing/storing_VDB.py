@@ -4,6 +4,8 @@ from preprocessing import extract_text_from_pdf, save_text_chunks
 import os
 import hashlib  # For generating unique IDs
 
+BATCH_SIZE = 1000  # Chunks per collection.add() call
+
 # Load embedding model
 model = SentenceTransformer("all-MiniLM-L6-v2")
 
@@ -18,24 +20,38 @@ if os.path.exists(pdf_file):
     raw_text = extract_text_from_pdf(pdf_file)
     chunks = save_text_chunks(raw_text)
     
-    # Fetch existing document IDs to prevent duplication
-    existing_docs = collection.get()["ids"]
+    # Fetch existing document IDs (ids only, no payloads) to prevent duplication
+    existing_docs = set(collection.get(include=[])["ids"])
     
-    # Insert document chunks (only if not already in DB)
+    # Collect document chunks not already in DB
+    new_ids, new_chunks = [], []
     for chunk in chunks:
         chunk_id = hashlib.md5(chunk.encode()).hexdigest()  # Unique ID for the text chunk
-        
-        if chunk_id not in existing_docs:  # Avoid duplicates
-            embedding = model.encode(chunk).tolist()
-            collection.add(ids=[chunk_id], embeddings=[embedding], metadatas=[{"text": chunk}])
-            print(f"added chunk id: {chunk_id}")
+
+        if chunk_id not in existing_docs:  # Avoid duplicates, also within this PDF
+            existing_docs.add(chunk_id)
+            new_ids.append(chunk_id)
+            new_chunks.append(chunk)
+
+    # Encode all new chunks in one batched call instead of one call per chunk
+    if new_chunks:
+        embeddings = model.encode(new_chunks).tolist()
+        # Insert in batches rather than one add() per chunk (stay under ChromaDB's max batch size)
+        for i in range(0, len(new_ids), BATCH_SIZE):
+            batch_ids = new_ids[i:i + BATCH_SIZE]
+            collection.add(
+                ids=batch_ids,
+                embeddings=embeddings[i:i + BATCH_SIZE],
+                metadatas=[{"text": chunk} for chunk in new_chunks[i:i + BATCH_SIZE]],
+            )
+            print(f"added {len(batch_ids)} chunks")
     
     print("New document chunks stored successfully!")
 else:
     print(f"PDF file not found: {pdf_file}")
 
 # Fetch all stored documents
-documents = collection.get()
+documents = collection.get(include=["metadatas"])  # Only metadatas are printed
 
 # Print the stored metadata (text chunks)
 for doc_id, metadata in zip(documents["ids"], documents["metadatas"]):
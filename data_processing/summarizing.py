@@ -9,6 +9,7 @@ import chromadb
 # Initialize models and database
 genai.configure(api_key=Gemini_API_KEY)
 model = SentenceTransformer('all-MiniLM-L6-v2')
+gemini_model = genai.GenerativeModel('gemini-pro')  # Created once, reused across queries
 client = chromadb.PersistentClient(path="db_3gpp")  # Persistent DB
 collection = client.get_or_create_collection("3gpp_specs")  # Avoid errors
 
@@ -37,8 +38,7 @@ def generate_summary(query):
     Provide a brief and accurate summary.
     """
 
-    model = genai.GenerativeModel('gemini-pro')
-    response = model.generate_content(prompt)
+    response = gemini_model.generate_content(prompt)
     
     return response.text.strip()
 